@@ -1,17 +1,30 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, ORJSONResponse, Response
+from contextlib import asynccontextmanager
 import httpx
 import os
 from pathlib import Path
 import asyncio
 import websockets
-import json
-from typing import Optional, Dict, Any
+import msgspec
+import orjson
+import pybase64
+import io
+from datetime import datetime
+from PIL import Image
+from typing import Optional, Dict, Any, Union
 import logging
+import logging.handlers
+import queue
+import atexit
+import time
 import argparse
+import sys
 import ssl
+import stat
+import re
+import hashlib
 from mcp_manager import MCPManager
 
 # Parse command line arguments
@@ -32,22 +45,116 @@ log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 logs_dir = Path(__file__).parent.parent / "logs"
 logs_dir.mkdir(exist_ok=True)
 
+LOG_BUFFER_SIZE = 64 * 1024  # Userspace buffer for backend.log writes
+LOG_FLUSH_INTERVAL = 0.05  # Max seconds a record may sit in the buffer
+
+
+class BinaryFileHandler(logging.Handler):
+    """
+    Log handler that appends UTF-8 encoded records to a binary, block-buffered file.
+    Records are encoded once and batched instead of going through a text wrapper and
+    being flushed one by one; the buffer is flushed when it fills up or when
+    LOG_FLUSH_INTERVAL has passed since the last flush.
+    """
+
+    def __init__(self, filename: Path):
+        super().__init__()
+        self._fp = open(filename, 'ab', buffering=LOG_BUFFER_SIZE)
+        self._last_flush = time.monotonic()
+
+    def emit(self, record):
+        try:
+            self._fp.write(self.format(record).encode('utf-8') + b'\n')
+            if time.monotonic() - self._last_flush >= LOG_FLUSH_INTERVAL:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self.lock:
+            if not self._fp.closed:
+                self._fp.flush()
+            self._last_flush = time.monotonic()
+
+    def close(self):
+        with self.lock:
+            try:
+                if not self._fp.closed:
+                    self._fp.flush()
+                    self._fp.close()
+            finally:
+                super().close()
+
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue has been idle for LOG_FLUSH_INTERVAL."""
+
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, timeout=LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+
 # Configure logging to both console and file
+# Records are queued and written by a background listener thread, so logging
+# never blocks the event loop on console or disk I/O
+log_formatter = logging.Formatter(log_format)
+console_handler = logging.StreamHandler()  # Console output
+console_handler.setFormatter(log_formatter)
+file_handler = BinaryFileHandler(logs_dir / "backend.log")
+file_handler.setFormatter(log_formatter)
+
+log_queue = queue.SimpleQueue()
+log_listener = FlushingQueueListener(
+    log_queue,
+    console_handler,
+    file_handler,
+    respect_handler_level=True
+)
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Final formatting is done by the listener's handlers
 logging.basicConfig(
     level=log_level,
-    format=log_format,
-    handlers=[
-        logging.StreamHandler(),  # Console output
-        logging.FileHandler(
-            logs_dir / "backend.log",
-            mode='a',
-            encoding='utf-8'
-        )
-    ]
+    handlers=[queue_handler]
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown."""
+    global mcp_manager
+
+    # One pooled HTTP client for all outbound API calls (keeps TLS connections alive).
+    # It gets its own SSL context because httpx configures HTTP/2 ALPN on it.
+    # The context manager closes it even if startup fails or is cancelled
+    async with httpx.AsyncClient(
+        verify=create_ssl_context(),
+        http2=True,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+        timeout=httpx.Timeout(30.0)
+    ) as http_client:
+        app.state.http_client = http_client
+
+        # Initialize MCP servers
+        mcp_manager = MCPManager(MCP_CONFIG_FILE)
+        try:
+            await mcp_manager.start_all()
+            refresh_mcp_tools_payload()
+            yield
+        finally:
+            # Cleanup MCP servers
+            await mcp_manager.stop_all()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Configuration: Enable debug logging for Realtime API events (uses DEBUG flag if not explicitly set)
 DEBUG_REALTIME_EVENTS = os.getenv("DEBUG_REALTIME_EVENTS", str(DEBUG).lower()).lower() == "true"
@@ -74,13 +181,39 @@ else:
 # You can get this from https://programmablesearchengine.google.com/
 GOOGLE_CX = os.getenv("GOOGLE_CX", "e2196f596bd834e0e")
 
-# SSL context for bypassing certificate verification (for SSL inspection proxies)
-ssl_context = ssl.SSLContext()
-ssl_context.check_hostname = False
-ssl_context.verify_mode = ssl.CERT_NONE
+def create_ssl_context() -> ssl.SSLContext:
+    """Create an SSL context that bypasses certificate verification (for SSL inspection proxies)."""
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    context.options |= ssl.OP_NO_COMPRESSION
+    return context
+
+
+# SSL context of the Realtime WebSocket. Not shared with the HTTP client: httpx sets HTTP/2 ALPN
+# protocols on its context, and a WebSocket upgrade needs an HTTP/1.1 connection
+ssl_context = create_ssl_context()
+
+# Media types served by /api/local-file, keyed by lowercase file extension
+MEDIA_TYPES = {
+    ".pdf": "application/pdf",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".txt": "text/plain",
+    ".json": "application/json",
+    ".xml": "application/xml",
+}
 
-# Store active WebSocket connections for cleanup
-active_connections: dict[str, asyncio.Task] = {}
+# Matches a '..' path segment with either separator (path traversal)
+_TRAVERSAL = re.compile(r'(?:^|[/\\])\.\.(?:[/\\]|$)')
+
+# Shared read-only default for missing nested objects in API responses
+_EMPTY: Dict[str, Any] = {}
+
+# Store active WebSocket connections for cleanup (a placeholder object while a task is being started)
+active_connections: dict[str, Any] = {}
 
 # MCP Manager configuration
 MCP_CONFIG_FILE = Path(__file__).parent.parent / "mcp-config.json"
@@ -101,20 +234,98 @@ app.add_middleware(
 )
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize MCP servers on startup."""
-    global mcp_manager
-    mcp_manager = MCPManager(MCP_CONFIG_FILE)
-    await mcp_manager.start_all()
+class RealtimeEvent(msgspec.Struct, tag_field="type"):
+    """
+    Base for Realtime API events the server-side connection branches on.
+    Payload fields are typed Any so a known event always decodes, whatever shape the API sends.
+    """
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup MCP servers on shutdown."""
-    global mcp_manager
-    if mcp_manager:
-        await mcp_manager.stop_all()
+class ConversationItemCreated(RealtimeEvent, tag="conversation.item.created"):
+    item: Any = None
+
+
+class FunctionCallArgumentsDone(RealtimeEvent, tag="response.function_call.arguments.done"):
+    name: Any = None
+
+
+class RealtimeError(RealtimeEvent, tag="error"):
+    error: Any = None
+
+
+class UnknownEvent(msgspec.Struct):
+    """Any other event; only the type is decoded, remaining fields are skipped."""
+    type: str = "unknown"
+
+
+# Realtime event pipeline: max frames buffered between the socket and the worker, and per wakeup
+REALTIME_QUEUE_SIZE = 1024
+REALTIME_BATCH_SIZE = 64
+
+# Reusable decoders for Realtime API events (accept both str and bytes frames)
+realtime_event_decoder = msgspec.json.Decoder(
+    Union[ConversationItemCreated, FunctionCallArgumentsDone, RealtimeError]
+)
+unknown_event_decoder = msgspec.json.Decoder(UnknownEvent)
+
+
+def handle_realtime_event(call_id: str, message) -> None:
+    """Decode a single Realtime API frame and dispatch it by event type."""
+    try:
+        try:
+            event = realtime_event_decoder.decode(message)
+            event_type = event.__struct_config__.tag
+        except msgspec.ValidationError:
+            # Unhandled event type (known types accept any payload, so only an unknown tag fails validation)
+            event = unknown_event_decoder.decode(message)
+            event_type = event.type
+
+        if DEBUG_REALTIME_EVENTS:
+            # Log all events when debug is enabled
+            logger.info("[REALTIME EVENT] call_id=%s type=%s", call_id, event_type)
+            if logger.isEnabledFor(logging.DEBUG):
+                # format() returns bytes for binary frames; decode so the log shows the JSON, not a bytes repr
+                details = msgspec.json.format(message, indent=2)
+                if isinstance(details, bytes):
+                    details = details.decode()
+                logger.debug("[REALTIME EVENT DETAILS] %s", details)
+
+        # Handle specific event types here
+        # Example: Respond to function calls, update session config, etc.
+        match event:
+            case ConversationItemCreated(item=item):
+                if DEBUG_REALTIME_EVENTS:
+                    logger.info("Conversation item created: %s", item.get("id") if isinstance(item, dict) else item)
+
+            case FunctionCallArgumentsDone(name=name):
+                if DEBUG_REALTIME_EVENTS:
+                    logger.info("Function call received: %s", name)
+                # Here you would handle tool/function calls
+
+            case RealtimeError(error=error):
+                logger.error("Realtime API error: %s", error)
+
+    except msgspec.DecodeError as e:
+        logger.error("Failed to parse event: %s", e)
+    except Exception as e:
+        logger.error("Error processing event: %s", e)
+
+
+async def process_realtime_events(call_id: str, event_queue: asyncio.Queue) -> None:
+    """
+    Consume raw Realtime API frames from the queue, handling whatever has accumulated
+    (up to REALTIME_BATCH_SIZE frames) per wakeup. A None item marks the end of the stream.
+    """
+    while True:
+        batch = [await event_queue.get()]
+        while len(batch) < REALTIME_BATCH_SIZE and not event_queue.empty():
+            batch.append(event_queue.get_nowait())
+
+        for message in batch:
+            if message is None:
+                return
+            handle_realtime_event(call_id, message)
+
 
 async def listen_to_realtime_events(call_id: str, ephemeral_key: str):
     """
@@ -131,7 +342,7 @@ async def listen_to_realtime_events(call_id: str, ephemeral_key: str):
     ws_url = f"wss://api.openai.com/v1/realtime?call_id={call_id}"
 
     try:
-        logger.info(f"Establishing server-side WebSocket connection for call_id: {call_id}")
+        logger.info("Establishing server-side WebSocket connection for call_id: %s", call_id)
 
         async with websockets.connect(
             ws_url,
@@ -140,7 +351,7 @@ async def listen_to_realtime_events(call_id: str, ephemeral_key: str):
             },
             ssl=ssl_context
         ) as websocket:
-            logger.info(f"Server-side WebSocket connected for call_id: {call_id}")
+            logger.info("Server-side WebSocket connected for call_id: %s", call_id)
 
             # Optionally send a session.update to configure the session from server-side
             # Example: Update instructions dynamically
@@ -153,44 +364,33 @@ async def listen_to_realtime_events(call_id: str, ephemeral_key: str):
             # }))
 
             # Listen for events from the Realtime API
-            async for message in websocket:
-                try:
-                    event = json.loads(message)
-                    event_type = event.get("type", "unknown")
-
-                    if DEBUG_REALTIME_EVENTS:
-                        # Log all events when debug is enabled
-                        logger.info(f"[REALTIME EVENT] call_id={call_id} type={event_type}")
-                        logger.debug(f"[REALTIME EVENT DETAILS] {json.dumps(event, indent=2)}")
-
-                    # Handle specific event types here
-                    # Example: Respond to function calls, update session config, etc.
-                    if event_type == "conversation.item.created":
-                        if DEBUG_REALTIME_EVENTS:
-                            logger.info(f"Conversation item created: {event.get('item', {}).get('id')}")
-
-                    elif event_type == "response.function_call.arguments.done":
-                        if DEBUG_REALTIME_EVENTS:
-                            logger.info(f"Function call received: {event.get('name')}")
-                        # Here you would handle tool/function calls
-
-                    elif event_type == "error":
-                        logger.error(f"Realtime API error: {event.get('error')}")
-
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse event: {e}")
-                except Exception as e:
-                    logger.error(f"Error processing event: {e}")
+            # The socket is drained into a bounded queue (put() applies backpressure when full)
+            # while a separate worker decodes and handles the frames in batches
+            event_queue: asyncio.Queue = asyncio.Queue(maxsize=REALTIME_QUEUE_SIZE)
+            worker = asyncio.create_task(process_realtime_events(call_id, event_queue))
+            cancelled = False
+            try:
+                async for message in websocket:
+                    await event_queue.put(message)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                if cancelled:
+                    worker.cancel()
+                else:
+                    # Also when the connection failed: frames already queued may explain the close
+                    await event_queue.put(None)  # End of stream
+                    await worker
 
     except websockets.exceptions.WebSocketException as e:
-        logger.error(f"WebSocket error for call_id {call_id}: {e}")
+        logger.error("WebSocket error for call_id %s: %s", call_id, e)
     except Exception as e:
-        logger.error(f"Unexpected error in server-side connection for call_id {call_id}: {e}")
+        logger.error("Unexpected error in server-side connection for call_id %s: %s", call_id, e)
     finally:
-        logger.info(f"Server-side WebSocket connection closed for call_id: {call_id}")
+        logger.info("Server-side WebSocket connection closed for call_id: %s", call_id)
         # Clean up the task reference
-        if call_id in active_connections:
-            del active_connections[call_id]
+        active_connections.pop(call_id, None)
 
 
 @app.post("/api/monitor")
@@ -211,7 +411,10 @@ async def start_monitoring(
             detail="Ephemeral key is required"
         )
 
-    if call_id in active_connections:
+    # Claim the call_id in a single step so concurrent requests for the same call
+    # cannot both start a monitoring connection
+    claim = object()
+    if active_connections.setdefault(call_id, claim) is not claim:
         logger.warning(f"Monitoring already active for call_id: {call_id}")
         return {"status": "already_monitoring", "call_id": call_id}
 
@@ -241,54 +444,53 @@ async def web_search(query: str):
         )
 
     try:
-        async with httpx.AsyncClient(verify=False) as client:
-            response = await client.post(
-                "https://api.openai.com/v1/responses",
-                headers={
-                    "Authorization": f"Bearer {OPENAI_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "gpt-4o",
-                    "tools": [
-                        {"type": "web_search"}
-                    ],
-                    "input": query
-                },
-                timeout=30.0
+        response = await app.state.http_client.post(
+            "https://api.openai.com/v1/responses",
+            headers={
+                "Authorization": f"Bearer {OPENAI_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": "gpt-4o",
+                "tools": [
+                    {"type": "web_search"}
+                ],
+                "input": query
+            },
+            timeout=30.0
+        )
+
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"OpenAI API error: {response.text}"
             )
 
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"OpenAI API error: {response.text}"
-                )
-
-            data = response.json()
-
-            # Extract the text response and citations
-            output_text = ""
-            citations = []
-
-            for item in data.get("output", []):
-                if item.get("type") == "message":
-                    content = item.get("content", [])
-                    for content_item in content:
-                        if content_item.get("type") == "output_text":
-                            output_text = content_item.get("text", "")
-                            annotations = content_item.get("annotations", [])
-                            for annotation in annotations:
-                                if annotation.get("type") == "url_citation":
-                                    citations.append({
-                                        "url": annotation.get("url"),
-                                        "title": annotation.get("title"),
-                                        "snippet": output_text[annotation.get("start_index", 0):annotation.get("end_index", 0)]
-                                    })
-
-            return {
-                "result": output_text,
-                "citations": citations
-            }
+        data = orjson.loads(response.content)
+
+        # Extract the text response and citations
+        output_text = ""
+        citations = []
+
+        for item in data.get("output", []):
+            if item.get("type") == "message":
+                content = item.get("content", [])
+                for content_item in content:
+                    if content_item.get("type") == "output_text":
+                        output_text = content_item.get("text", "")
+                        annotations = content_item.get("annotations", [])
+                        for annotation in annotations:
+                            if annotation.get("type") == "url_citation":
+                                citations.append({
+                                    "url": annotation.get("url"),
+                                    "title": annotation.get("title"),
+                                    "snippet": output_text[annotation.get("start_index", 0):annotation.get("end_index", 0)]
+                                })
+
+        return {
+            "result": output_text,
+            "citations": citations
+        }
 
     except httpx.RequestError as e:
         raise HTTPException(
@@ -303,8 +505,8 @@ async def google_search(query: str, num_results: int = 5):
     Perform a Google search using Google Custom Search API.
     Returns search results with titles, snippets, and links.
     """
-    if DEBUG:
-        logger.debug(f"[GOOGLE SEARCH] Received request - query: '{query}', num_results: {num_results}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[GOOGLE SEARCH] Received request - query: '%s', num_results: %s", query, num_results)
 
     if not GOOGLE_API_KEY:
         logger.error("[GOOGLE SEARCH] Google API key not configured")
@@ -321,56 +523,56 @@ async def google_search(query: str, num_results: int = 5):
             "num": min(num_results, 10)
         }
 
-        if DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             # Log params without exposing the full API key
             safe_params = params.copy()
             safe_params["key"] = f"{GOOGLE_API_KEY[:10]}..." if GOOGLE_API_KEY else "None"
-            logger.debug(f"[GOOGLE SEARCH] Request params: {safe_params}")
+            logger.debug("[GOOGLE SEARCH] Request params: %s", safe_params)
 
-        async with httpx.AsyncClient(verify=False) as client:
-            response = await client.get(
-                "https://www.googleapis.com/customsearch/v1",
-                params=params,
-                timeout=10.0
+        response = await app.state.http_client.get(
+            "https://www.googleapis.com/customsearch/v1",
+            params=params,
+            timeout=10.0
+        )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[GOOGLE SEARCH] Response status: %s", response.status_code)
+
+        if response.status_code != 200:
+            logger.error("[GOOGLE SEARCH] API error: %s - %s", response.status_code, response.text[:200])
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"Google API error: {response.text}"
             )
 
-            if DEBUG:
-                logger.debug(f"[GOOGLE SEARCH] Response status: {response.status_code}")
-
-            if response.status_code != 200:
-                logger.error(f"[GOOGLE SEARCH] API error: {response.status_code} - {response.text[:200]}")
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Google API error: {response.text}"
-                )
-
-            data = response.json()
-
-            # Extract search results
-            results = []
-            for item in data.get("items", []):
-                results.append({
-                    "title": item.get("title"),
-                    "link": item.get("link"),
-                    "snippet": item.get("snippet"),
-                    "display_link": item.get("displayLink")
-                })
-
-            total_results = data.get("searchInformation", {}).get("totalResults", "0")
-
-            if DEBUG:
-                logger.debug(f"[GOOGLE SEARCH] Found {len(results)} results (total available: {total_results})")
-                for idx, result in enumerate(results[:3], 1):  # Log first 3 results
-                    logger.debug(f"[GOOGLE SEARCH]   {idx}. {result['title'][:50]}... - {result['link']}")
-
-            return {
-                "query": query,
-                "total_results": total_results,
-                "results": results
+        data = orjson.loads(response.content)
+
+        # Extract search results
+        results = [
+            {
+                "title": item.get("title"),
+                "link": item.get("link"),
+                "snippet": item.get("snippet"),
+                "display_link": item.get("displayLink")
             }
+            for item in data.get("items", ())
+        ]
+
+        total_results = data.get("searchInformation", {}).get("totalResults", "0")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[GOOGLE SEARCH] Found %d results (total available: %s)", len(results), total_results)
+            for idx, result in enumerate(results[:3], 1):  # Log first 3 results
+                logger.debug("[GOOGLE SEARCH]   %d. %.50s... - %s", idx, result['title'], result['link'])
+
+        return {
+            "query": query,
+            "total_results": total_results,
+            "results": results
+        }
 
     except httpx.RequestError as e:
-        logger.error(f"[GOOGLE SEARCH] Connection error: {str(e)}")
+        logger.error("[GOOGLE SEARCH] Connection error: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to connect to Google API: {str(e)}"
@@ -383,8 +585,8 @@ async def google_image_search(query: str, num_results: int = 5):
     Perform a Google image search using Google Custom Search API.
     Returns image URLs with thumbnails and context.
     """
-    if DEBUG:
-        logger.debug(f"[GOOGLE IMAGE SEARCH] Received request - query: '{query}', num_results: {num_results}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[GOOGLE IMAGE SEARCH] Received request - query: '%s', num_results: %s", query, num_results)
 
     if not GOOGLE_API_KEY:
         logger.error("[GOOGLE IMAGE SEARCH] Google API key not configured")
@@ -402,59 +604,58 @@ async def google_image_search(query: str, num_results: int = 5):
             "num": min(num_results, 10)
         }
 
-        if DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             # Log params without exposing the full API key
             safe_params = params.copy()
             safe_params["key"] = f"{GOOGLE_API_KEY[:10]}..." if GOOGLE_API_KEY else "None"
-            logger.debug(f"[GOOGLE IMAGE SEARCH] Request params: {safe_params}")
+            logger.debug("[GOOGLE IMAGE SEARCH] Request params: %s", safe_params)
+
+        response = await app.state.http_client.get(
+            "https://www.googleapis.com/customsearch/v1",
+            params=params,
+            timeout=10.0
+        )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[GOOGLE IMAGE SEARCH] Response status: %s", response.status_code)
 
-        async with httpx.AsyncClient(verify=False) as client:
-            response = await client.get(
-                "https://www.googleapis.com/customsearch/v1",
-                params=params,
-                timeout=10.0
+        if response.status_code != 200:
+            logger.error("[GOOGLE IMAGE SEARCH] API error: %s - %s", response.status_code, response.text[:200])
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"Google API error: {response.text}"
             )
 
-            if DEBUG:
-                logger.debug(f"[GOOGLE IMAGE SEARCH] Response status: {response.status_code}")
-
-            if response.status_code != 200:
-                logger.error(f"[GOOGLE IMAGE SEARCH] API error: {response.status_code} - {response.text[:200]}")
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Google API error: {response.text}"
-                )
-
-            data = response.json()
-
-            # Extract image results
-            results = []
-            for item in data.get("items", []):
-                image_info = item.get("image", {})
-                results.append({
-                    "title": item.get("title"),
-                    "link": item.get("link"),  # Full size image URL
-                    "thumbnail": image_info.get("thumbnailLink"),
-                    "context_link": image_info.get("contextLink"),  # Page where image was found
-                    "width": image_info.get("width"),
-                    "height": image_info.get("height")
-                })
-
-            total_results = data.get("searchInformation", {}).get("totalResults", "0")
-
-            if DEBUG:
-                logger.debug(f"[GOOGLE IMAGE SEARCH] Found {len(results)} images (total available: {total_results})")
-                for idx, result in enumerate(results[:3], 1):  # Log first 3 results
-                    logger.debug(f"[GOOGLE IMAGE SEARCH]   {idx}. {result['title'][:50]}... ({result['width']}x{result['height']}) - {result['link'][:80]}...")
-
-            return {
-                "query": query,
-                "total_results": total_results,
-                "results": results
+        data = orjson.loads(response.content)
+
+        # Extract image results
+        results = [
+            {
+                "title": item.get("title"),
+                "link": item.get("link"),  # Full size image URL
+                "thumbnail": (image_info := item.get("image") or _EMPTY).get("thumbnailLink"),
+                "context_link": image_info.get("contextLink"),  # Page where image was found
+                "width": image_info.get("width"),
+                "height": image_info.get("height")
             }
+            for item in data.get("items", ())
+        ]
+
+        total_results = data.get("searchInformation", {}).get("totalResults", "0")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[GOOGLE IMAGE SEARCH] Found %d images (total available: %s)", len(results), total_results)
+            for idx, result in enumerate(results[:3], 1):  # Log first 3 results
+                logger.debug("[GOOGLE IMAGE SEARCH]   %d. %.50s... (%sx%s) - %.80s...", idx, result['title'], result['width'], result['height'], result['link'])
+
+        return {
+            "query": query,
+            "total_results": total_results,
+            "results": results
+        }
 
     except httpx.RequestError as e:
-        logger.error(f"[GOOGLE IMAGE SEARCH] Connection error: {str(e)}")
+        logger.error("[GOOGLE IMAGE SEARCH] Connection error: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to connect to Google API: {str(e)}"
@@ -475,30 +676,29 @@ async def get_ephemeral_token():
         )
 
     try:
-        async with httpx.AsyncClient(verify=False) as client:
-            response = await client.post(
-                "https://api.openai.com/v1/realtime/client_secrets",
-                headers={
-                    "Authorization": f"Bearer {OPENAI_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "session": {
-                        "type": "realtime",
-                        "model": "gpt-realtime"
-                    }
-                },
-                timeout=10.0
-            )
+        response = await app.state.http_client.post(
+            "https://api.openai.com/v1/realtime/client_secrets",
+            headers={
+                "Authorization": f"Bearer {OPENAI_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "session": {
+                    "type": "realtime",
+                    "model": "gpt-realtime"
+                }
+            },
+            timeout=10.0
+        )
 
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"OpenAI API error: {response.text}"
-                )
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"OpenAI API error: {response.text}"
+            )
 
-            data = response.json()
-            return {"token": data.get("value"), "expires_at": data.get("expires_at")}
+        data = orjson.loads(response.content)
+        return {"token": data.get("value"), "expires_at": data.get("expires_at")}
 
     except httpx.RequestError as e:
         raise HTTPException(
@@ -507,43 +707,71 @@ async def get_ephemeral_token():
         )
 
 
+def refresh_mcp_tools_payload() -> None:
+    """
+    Serialize the MCP tool list once and cache it (with an ETag) on app.state.
+    Must be called again whenever the set of running MCP servers changes.
+    """
+    tools = mcp_manager.get_all_tools() if mcp_manager else []
+    payload = orjson.dumps({"tools": tools})
+    app.state.mcp_tools_payload = payload
+    app.state.mcp_tools_etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+
+
 @app.get("/api/mcp-tools")
-async def get_mcp_tools():
+async def get_mcp_tools(http_request: Request):
     """
     Get all available tools from configured MCP servers.
     Returns a list of tools with their schemas for the frontend to register.
+    The payload is computed once after the MCP servers start; clients can revalidate with If-None-Match.
     """
-    if not mcp_manager:
-        return {"tools": []}
+    etag = app.state.mcp_tools_etag
+    if http_request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
 
-    try:
-        tools = mcp_manager.get_all_tools()
-        return {"tools": tools}
-    except Exception as e:
-        logger.error(f"Failed to get MCP tools: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get MCP tools: {str(e)}"
-        )
+    return Response(
+        content=app.state.mcp_tools_payload,
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
 
 
-class MCPToolCallRequest(BaseModel):
+class MCPToolCallRequest(msgspec.Struct):
     tool_name: str
     arguments: Dict[str, Any]
 
 
-class SaveImageRequest(BaseModel):
+class SaveImageRequest(msgspec.Struct):
     image_data: str  # Base64 encoded image data
     directory: str   # Directory path to save the image
     filename: Optional[str] = None  # Optional filename, auto-generated if not provided
+    optimize: bool = False  # Optional extra JPEG optimization pass (slower encode, slightly smaller file)
+
+
+# Request body decoders (msgspec validates and builds the structs in a single pass)
+mcp_tool_call_decoder = msgspec.json.Decoder(MCPToolCallRequest)
+save_image_decoder = msgspec.json.Decoder(SaveImageRequest)
+
+
+async def decode_body(http_request: Request, decoder: msgspec.json.Decoder) -> Any:
+    """Decode and validate a JSON request body, raising 422 on malformed input."""
+    try:
+        return decoder.decode(await http_request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid request body: {str(e)}"
+        )
 
 
 @app.post("/api/mcp-call")
-async def call_mcp_tool(request: MCPToolCallRequest):
+async def call_mcp_tool(http_request: Request):
     """
     Execute a tool call on the appropriate MCP server.
     The tool_name should be in the format: servername__toolname
     """
+    request: MCPToolCallRequest = await decode_body(http_request, mcp_tool_call_decoder)
+
     if not mcp_manager:
         raise HTTPException(
             status_code=500,
@@ -563,65 +791,75 @@ async def call_mcp_tool(request: MCPToolCallRequest):
         )
 
 
+def _encode_and_save(image_bytes: bytes, directory: str, filename: Optional[str], optimize: bool) -> Dict[str, Any]:
+    """
+    Decode image bytes, convert to RGB and write them as a JPEG file.
+    CPU-bound, so it is run in a worker thread to keep the event loop responsive.
+    """
+    # Open image with PIL
+    image = Image.open(io.BytesIO(image_bytes))
+
+    # Convert to RGB if necessary (JPEG doesn't support transparency)
+    if image.mode in ('RGBA', 'LA', 'P'):
+        # Create white background
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        if image.mode == 'P':
+            image = image.convert('RGBA')
+        background.paste(image, mask=image.split()[-1] if image.mode in ('RGBA', 'LA') else None)
+        image = background
+    elif image.mode != 'RGB':
+        image = image.convert('RGB')
+
+    # Resolve directory path
+    directory_path = Path(directory).expanduser().resolve()
+
+    # Create directory if it doesn't exist
+    directory_path.mkdir(parents=True, exist_ok=True)
+
+    # Generate filename if not provided
+    if filename:
+        # Ensure .jpg or .jpeg extension
+        if not filename.lower().endswith(('.jpg', '.jpeg')):
+            filename += '.jpg'
+    else:
+        # Auto-generate filename with timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+        filename = f"image_{timestamp}.jpg"
+
+    # Full file path
+    file_path = directory_path / filename
+
+    # Save as JPEG with high quality (optimize runs an extra Huffman pass, so it is opt-in)
+    image.save(file_path, 'JPEG', quality=95, optimize=optimize)
+
+    logger.info(f"Saved image to: {file_path}")
+
+    return {
+        "success": True,
+        "path": str(file_path),
+        "filename": filename,
+        "directory": str(directory_path)
+    }
+
+
 @app.post("/api/save-image")
-async def save_image(request: SaveImageRequest):
+async def save_image(http_request: Request):
     """
     Save a base64-encoded image as a JPEG file to the specified directory.
     """
-    import base64
-    from datetime import datetime
-    from PIL import Image
-    import io
+    request: SaveImageRequest = await decode_body(http_request, save_image_decoder)
 
     try:
-        # Decode base64 image data
-        image_bytes = base64.b64decode(request.image_data)
-
-        # Open image with PIL
-        image = Image.open(io.BytesIO(image_bytes))
-
-        # Convert to RGB if necessary (JPEG doesn't support transparency)
-        if image.mode in ('RGBA', 'LA', 'P'):
-            # Create white background
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            if image.mode == 'P':
-                image = image.convert('RGBA')
-            background.paste(image, mask=image.split()[-1] if image.mode in ('RGBA', 'LA') else None)
-            image = background
-        elif image.mode != 'RGB':
-            image = image.convert('RGB')
-
-        # Resolve directory path
-        directory = Path(request.directory).expanduser().resolve()
-
-        # Create directory if it doesn't exist
-        directory.mkdir(parents=True, exist_ok=True)
-
-        # Generate filename if not provided
-        if request.filename:
-            filename = request.filename
-            # Ensure .jpg or .jpeg extension
-            if not filename.lower().endswith(('.jpg', '.jpeg')):
-                filename += '.jpg'
-        else:
-            # Auto-generate filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
-            filename = f"image_{timestamp}.jpg"
-
-        # Full file path
-        file_path = directory / filename
-
-        # Save as JPEG with high quality
-        image.save(file_path, 'JPEG', quality=95, optimize=True)
-
-        logger.info(f"Saved image to: {file_path}")
-
-        return {
-            "success": True,
-            "path": str(file_path),
-            "filename": filename,
-            "directory": str(directory)
-        }
+        # Decode base64 image data (SIMD-accelerated)
+        image_bytes = pybase64.b64decode(request.image_data, validate=False)
+
+        return await asyncio.to_thread(
+            _encode_and_save,
+            image_bytes,
+            request.directory,
+            request.filename,
+            request.optimize
+        )
 
     except Exception as e:
         logger.error(f"Failed to save image: {e}", exc_info=True)
@@ -642,33 +880,41 @@ async def get_local_file(path: str):
     Path traversal attempts (e.g., '../../../etc/passwd') are rejected.
     """
     try:
-        file_path = Path(path).resolve()
-
-        # Security: Reject paths with parent directory references before resolution
+        # Security: Reject paths with parent directory references
         # This prevents path traversal attacks like '../../../etc/passwd'
-        if '..' in Path(path).parts:
+        if _TRAVERSAL.search(path):
             logger.warning(f"[LOCAL FILE] Path traversal attempt detected: {path}")
             raise HTTPException(
                 status_code=400,
                 detail="Path traversal is not allowed"
             )
 
-        # Validate that the file exists and is actually a file (not a directory)
-        if not file_path.exists():
+        file_path = Path(path)
+
+        # Validate that the file exists and is actually a file (not a directory) with a single stat
+        try:
+            st = file_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             logger.warning(f"[LOCAL FILE] File not found: {path}")
             raise HTTPException(
                 status_code=404,
                 detail=f"File not found: {path}"
             )
+        except PermissionError:
+            logger.warning(f"[LOCAL FILE] File not readable: {path}")
+            raise HTTPException(
+                status_code=403,
+                detail=f"File not readable: {path}"
+            )
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             logger.warning(f"[LOCAL FILE] Path is not a file: {path}")
             raise HTTPException(
                 status_code=400,
                 detail=f"Path is not a file: {path}"
             )
 
-        # Check if file is readable
+        # Check if file is readable (FileResponse sends the headers before opening the file)
         if not os.access(file_path, os.R_OK):
             logger.warning(f"[LOCAL FILE] File not readable: {path}")
             raise HTTPException(
@@ -677,35 +923,19 @@ async def get_local_file(path: str):
             )
 
         # Determine media type based on file extension
-        media_type = "application/octet-stream"
-        extension = file_path.suffix.lower()
-
-        if extension == ".pdf":
-            media_type = "application/pdf"
-        elif extension in [".jpg", ".jpeg"]:
-            media_type = "image/jpeg"
-        elif extension == ".png":
-            media_type = "image/png"
-        elif extension == ".gif":
-            media_type = "image/gif"
-        elif extension == ".txt":
-            media_type = "text/plain"
-        elif extension == ".json":
-            media_type = "application/json"
-        elif extension == ".xml":
-            media_type = "application/xml"
+        media_type = MEDIA_TYPES.get(file_path.suffix.lower(), "application/octet-stream")
 
         logger.info(f"[LOCAL FILE] Serving file: {path} (type: {media_type})")
 
         # Return the file with appropriate headers
         # Set Content-Disposition to 'inline' so browsers display PDFs/images instead of downloading
+        # Passing stat_result lets Starlette build Content-Length/Last-Modified/ETag without a second stat
         return FileResponse(
             path=str(file_path),
             media_type=media_type,
             filename=file_path.name,
-            headers={
-                "Content-Disposition": f'inline; filename="{file_path.name}"'
-            }
+            stat_result=st,
+            content_disposition_type="inline"
         )
 
     except HTTPException:
@@ -730,4 +960,15 @@ if __name__ == "__main__":
     logger.info(f"Log File: {logs_dir / 'backend.log'}")
     logger.info("=" * 60)
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Pin the C-accelerated stack (uvloop is not available on Windows) and let the
+    # root logger handle uvicorn's messages instead of a separate access log
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets",
+        log_config=None,
+        access_log=False
+    )
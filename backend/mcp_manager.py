@@ -6,82 +6,244 @@ Compatible with Claude Desktop MCP server configuration format.
 """
 
 import asyncio
+import itertools
 import json
 import logging
+import os
+import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import uuid
+from typing import Callable, Dict, List, Optional, Any, Tuple
 import shutil
 import sys
 
 logger = logging.getLogger(__name__)
 
+# JSON-RPC serialization: use orjson when available (bytes in/out, several times faster)
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is the same
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+# Default stream limit (max line length) for MCP server stdout.
+# Large enough for big responses like base64 images from screenshot servers.
+DEFAULT_STREAM_LIMIT = 16 * 1024 * 1024  # 16MB
+
+# Pre-encoded JSON-RPC envelopes (completed with the encoded params and a closing brace)
+_REQUEST_ENVELOPE = b'{"jsonrpc":"2.0","id":%d,"method":%b,"params":'
+_NOTIFICATION_ENVELOPE = b'{"jsonrpc":"2.0","method":%b'
+
+# Bytes kept from the start and the end of a discarded oversized message, to find out what it was
+OVERSIZED_PEEK_SIZE = 256
+
+# Top-level keys that tell a response (and its id) apart from a notification or server request.
+# A response id is found either first in the message or as its very last member.
+_MESSAGE_KEY = re.compile(rb'"(id|method|params|result|error)"\s*:\s*(-?\d+)?')
+_TRAILING_ID = re.compile(rb'"id"\s*:\s*(-?\d+)\s*\}\s*$')
+
+
+class JSONRPCFramer:
+    """
+    Splits a byte stream into newline-delimited JSON-RPC frames.
+
+    Each chunk received from the pipe is scanned once for newlines and complete frames are sliced
+    straight out of it; only an unterminated tail is copied into a buffer until the rest arrives.
+    Each complete frame is passed to on_frame; frames larger than limit (complete or not) are
+    discarded and, once they end, reported to on_oversized with their first and last bytes.
+    """
+
+    def __init__(self, on_frame: Callable[[bytes], None], on_oversized: Callable[[bytes, bytes], None], limit: int, name: str):
+        self._on_frame = on_frame
+        self._on_oversized = on_oversized
+        self._limit = limit
+        self._name = name
+        self._partial = bytearray()  # Start of a frame whose newline hasn't arrived yet
+        self._discarding = False  # Skipping the rest of an oversized frame
+        self._dropped_head = b""  # First and last bytes of the frame being skipped
+        self._dropped_tail = b""
+
+    def feed(self, data: bytes) -> None:
+        start = 0
+
+        # Complete (or keep skipping) the frame left over from the previous chunks
+        if self._partial or self._discarding:
+            newline = data.find(b"\n")
+            if newline == -1:
+                self._buffer_tail(data, 0)
+                return
+            if self._discarding:
+                self._discarding = False
+                tail = self._dropped_tail + data[max(0, newline - OVERSIZED_PEEK_SIZE):newline]
+                self._on_oversized(self._dropped_head, tail[-OVERSIZED_PEEK_SIZE:])
+            else:
+                self._partial += memoryview(data)[:newline]
+                frame, self._partial = self._partial, bytearray()
+                self._emit(frame)
+            start = newline + 1
+
+        # Each chunk is scanned once, so newline framing stays linear (no need for length-prefixed framing)
+        while (newline := data.find(b"\n", start)) != -1:
+            if newline > start:
+                self._emit(data[start:newline])
+            start = newline + 1
+
+        if start < len(data):
+            self._buffer_tail(data, start)
+
+    def _emit(self, frame: bytes) -> None:
+        if len(frame) > self._limit:
+            self._log_oversized()
+            self._on_oversized(frame[:OVERSIZED_PEEK_SIZE], frame[-OVERSIZED_PEEK_SIZE:])
+        else:
+            self._on_frame(frame)
+
+    def _buffer_tail(self, data: bytes, start: int) -> None:
+        """Keep the unterminated end of a chunk until the rest of the frame arrives."""
+        if self._discarding:
+            self._dropped_tail = (self._dropped_tail + data[max(start, len(data) - OVERSIZED_PEEK_SIZE):])[-OVERSIZED_PEEK_SIZE:]
+            return
+
+        self._partial += memoryview(data)[start:]
+        if len(self._partial) > self._limit:
+            # Skip the rest of the frame up to its newline; it is reported when it ends
+            self._log_oversized()
+            self._dropped_head = bytes(self._partial[:OVERSIZED_PEEK_SIZE])
+            self._dropped_tail = bytes(self._partial[-OVERSIZED_PEEK_SIZE:])
+            self._discarding = True
+            self._partial = bytearray()
+
+    def _log_oversized(self) -> None:
+        logger.error("Message from MCP server '%s' exceeds the stream limit of %d bytes, discarding it", self._name, self._limit)
+
+
+class MCPSubprocessProtocol(asyncio.SubprocessProtocol):
+    """
+    Subprocess protocol that owns all three stdio pipes of an MCP server, without the
+    StreamReader/StreamWriter wrappers of asyncio.subprocess:
+    stdout chunks are fed straight into a JSONRPCFramer, stderr lines are logged, and stdin is written
+    through the pipe transport, with pause_writing/resume_writing providing the backpressure.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, framer: JSONRPCFramer, name: str, limit: int,
+                 on_stdin_lost: Callable[[Optional[Exception]], None]):
+        self._loop = loop
+        self._framer = framer
+        self._name = name
+        self._limit = limit
+        self._on_stdin_lost = on_stdin_lost
+        self._stderr = bytearray()  # Incomplete stderr line
+        self._writable: Optional[asyncio.Future] = None  # Resolved when stdin accepts data again
+        self.paused = False  # stdin write buffer is above its high-water mark
+        self.exited = loop.create_future()  # Resolved when the process exits
+
+    def pipe_data_received(self, fd: int, data: bytes) -> None:
+        if fd == 1:
+            self._framer.feed(data)
+        elif fd == 2:
+            self._stderr += data
+            if b"\n" in data:
+                *lines, self._stderr = self._stderr.split(b"\n")
+                for line in lines:
+                    self._log_stderr(line)
+            elif len(self._stderr) > self._limit:
+                self._log_stderr(self._stderr)
+                self._stderr = bytearray()
+
+    def _log_stderr(self, line: bytes) -> None:
+        stderr_text = line.decode(errors="replace").strip()
+        if stderr_text:
+            logger.warning("[%s stderr] %s", self._name, stderr_text)
+
+    def pipe_connection_lost(self, fd: int, exc: Optional[Exception]) -> None:
+        if fd == 0:
+            self._on_stdin_lost(exc)
+            self.resume_writing()
+        elif fd == 2 and self._stderr:
+            self._log_stderr(self._stderr)
+            self._stderr = bytearray()
+
+    def pause_writing(self) -> None:
+        self.paused = True
+
+    def resume_writing(self) -> None:
+        self.paused = False
+        if self._writable is not None:
+            if not self._writable.done():
+                self._writable.set_result(None)
+            self._writable = None
+
+    async def wait_writable(self) -> None:
+        """Wait until the stdin write buffer drops below its low-water mark (or stdin is closed)."""
+        if not self.paused:
+            return
+        if self._writable is None:
+            self._writable = self._loop.create_future()
+        # Shielded so one cancelled writer doesn't cancel the wait for the others
+        await asyncio.shield(self._writable)
+
+    def process_exited(self) -> None:
+        if not self.exited.done():
+            self.exited.set_result(None)
+
 
 class MCPServer:
     """Represents a single MCP server connection using stdio transport."""
 
-    def __init__(self, name: str, command: str, args: List[str], env: Optional[Dict[str, str]] = None, timeout: float = 120.0):
+    def __init__(self, name: str, command: str, args: List[str], env: Optional[Dict[str, str]] = None, timeout: float = 120.0,
+                 stream_limit: int = DEFAULT_STREAM_LIMIT, command_path: Optional[str] = None):
         self.name = name
         self.command = command
+        self.command_path = command_path  # Already resolved path of command (looked up in PATH on start if not given)
         self.args = args
         self.env = env or {}
+        self._merged_env = {**os.environ, **self.env}  # Process environment plus server-specific variables
         self.timeout = timeout  # Timeout for tool calls in seconds
-        self.process: Optional[asyncio.subprocess.Process] = None
+        self.stream_limit = stream_limit  # Max size of a single JSON-RPC message in bytes
+        self.transport: Optional[asyncio.SubprocessTransport] = None
+        self.protocol: Optional[MCPSubprocessProtocol] = None
+        self._stdin: Optional[asyncio.WriteTransport] = None
         self.message_id_counter = 0
-        self.pending_requests: Dict[str, asyncio.Future] = {}
+        self.pending_requests: Dict[int, asyncio.Future] = {}
         self.tools: List[Dict[str, Any]] = []
-        self.reader_task: Optional[asyncio.Task] = None
+        self._prefixed_tools: List[Dict[str, Any]] = []
 
     async def start(self) -> None:
         """Start the MCP server process."""
         try:
-            # Prepare environment variables
-            import os
-            env = os.environ.copy()
-            env.update(self.env)
-
             # Resolve command path (handles .cmd/.bat files on Windows)
-            command_path = shutil.which(self.command)
+            command_path = self.command_path or shutil.which(self.command)
             if not command_path:
                 logger.error(f"Command '{self.command}' not found in PATH. Please ensure it's installed and available.")
                 raise FileNotFoundError(f"Command not found: {self.command}")
 
-            logger.debug(f"Resolved command '{self.command}' to '{command_path}'")
+            logger.debug("Resolved command '%s' to '%s'", self.command, command_path)
 
             # On Windows, we need to use shell=True for .cmd/.bat files, or run them via cmd
-            # Increase stream limit to 10MB to handle large responses (like base64 images from screenshot servers)
-            stream_limit = 10 * 1024 * 1024  # 10MB
-
             if sys.platform == 'win32' and command_path.lower().endswith(('.cmd', '.bat')):
                 # Run the command through cmd.exe on Windows
-                full_command = [command_path] + self.args
-                self.process = await asyncio.create_subprocess_exec(
-                    'cmd',
-                    '/c',
-                    *full_command,
-                    stdin=asyncio.subprocess.PIPE,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    env=env,
-                    limit=stream_limit
-                )
+                full_command = ['cmd', '/c', command_path] + self.args
             else:
                 # Unix or direct executable
-                self.process = await asyncio.create_subprocess_exec(
-                    command_path,
-                    *self.args,
-                    stdin=asyncio.subprocess.PIPE,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    env=env,
-                    limit=stream_limit
-                )
-
-            # Start reading responses
-            self.reader_task = asyncio.create_task(self._read_responses())
-
-            # Start reading stderr for logging
-            asyncio.create_task(self._read_stderr())
+                full_command = [command_path] + self.args
+
+            # stdout is framed by our own protocol, which hands each complete message to _handle_frame
+            loop = asyncio.get_running_loop()
+            framer = JSONRPCFramer(self._handle_frame, self._message_too_large, self.stream_limit, self.name)
+            self.transport, self.protocol = await loop.subprocess_exec(
+                lambda: MCPSubprocessProtocol(loop, framer, self.name, self.stream_limit, self._stdin_lost),
+                *full_command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=self._merged_env
+            )
+            self._stdin = self.transport.get_pipe_transport(0)
 
             # Initialize the connection
             await self._initialize()
@@ -114,10 +276,9 @@ class MCPServer:
         if "error" in init_response:
             raise Exception(f"Initialize failed: {init_response['error']}")
 
-        # Send initialized notification
-        await self._send_notification("notifications/initialized")
-
-        # Fetch available tools
+        # Write the initialized notification and the tools/list request back to back; both go
+        # straight to the stdin pipe transport in order, with no await in between
+        self._send_notification("notifications/initialized")
         await self._fetch_tools()
 
     async def _fetch_tools(self) -> None:
@@ -129,105 +290,134 @@ class MCPServer:
             return
 
         self.tools = response.get("result", {}).get("tools", [])
+
+        # Add server name prefix to tool names to avoid conflicts (computed once, served by get_tools)
+        self._prefixed_tools = [
+            {**tool, "name": f"{self.name}__{tool['name']}", "mcp_server": self.name, "original_name": tool["name"]}
+            for tool in self.tools
+        ]
         logger.info(f"Fetched {len(self.tools)} tools from MCP server '{self.name}'")
 
     async def _send_request(self, method: str, params: Any) -> Dict[str, Any]:
         """Send a JSON-RPC request and wait for response."""
-        if not self.process or not self.process.stdin:
-            raise Exception(f"MCP server '{self.name}' is not running")
+        if self.protocol and self.protocol.paused:
+            # Backpressure: the server isn't reading its stdin fast enough
+            await self.protocol.wait_writable()
 
-        # Generate unique request ID
-        request_id = str(uuid.uuid4())
+        # Generate unique request ID (JSON-RPC allows integer ids)
         self.message_id_counter += 1
+        request_id = self.message_id_counter
 
-        # Create request
-        request = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "method": method,
-            "params": params
-        }
+        # Encode request: the envelope is fixed, so only the method and params go through the encoder
+        request = _REQUEST_ENVELOPE % (request_id, _dumps(method)) + _dumps(params) + b"}\n"
 
         # Create future for the response
-        future = asyncio.Future()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
         self.pending_requests[request_id] = future
 
         # Send request
-        request_json = json.dumps(request) + "\n"
-        self.process.stdin.write(request_json.encode())
-        await self.process.stdin.drain()
-
-        # Wait for response (with timeout)
         try:
-            response = await asyncio.wait_for(future, timeout=self.timeout)
-            return response
-        except asyncio.TimeoutError:
+            self._write(request)
+        except Exception:
             del self.pending_requests[request_id]
+            raise
+
+        # Wait for response; a plain timer resolves the future with an error on timeout
+        timeout_handle = loop.call_later(self.timeout, self._timeout_request, request_id, method)
+        try:
+            return await future
+        finally:
+            # Always drop the timer and the entry, whether answered, timed out or cancelled
+            timeout_handle.cancel()
+            self.pending_requests.pop(request_id, None)
+
+    def _timeout_request(self, request_id: int, method: str) -> None:
+        """Resolve a pending request with a timeout error (called by the request's timer)."""
+        future = self.pending_requests.pop(request_id, None)
+        if future and not future.done():
             logger.warning(f"MCP server '{self.name}' method '{method}' timed out after {self.timeout}s")
-            return {"error": {"code": -1, "message": f"Request timeout after {self.timeout}s"}}
+            future.set_result({"error": {"code": -1, "message": f"Request timeout after {self.timeout}s"}})
 
-    async def _send_notification(self, method: str, params: Any = None) -> None:
-        """Send a JSON-RPC notification (no response expected)."""
-        if not self.process or not self.process.stdin:
-            raise Exception(f"MCP server '{self.name}' is not running")
+    def _send_notification(self, method: str, params: Any = None) -> None:
+        """Send a JSON-RPC notification (no response expected, does not wait)."""
+        if params is None:
+            notification = _NOTIFICATION_ENVELOPE % _dumps(method) + b"}\n"
+        else:
+            notification = _NOTIFICATION_ENVELOPE % _dumps(method) + b',"params":' + _dumps(params) + b"}\n"
 
-        notification = {
-            "jsonrpc": "2.0",
-            "method": method,
-        }
-        if params is not None:
-            notification["params"] = params
+        self._write(notification)
 
-        notification_json = json.dumps(notification) + "\n"
-        self.process.stdin.write(notification_json.encode())
-        await self.process.stdin.drain()
+    def _write(self, frame: bytes) -> None:
+        """Write an encoded frame to the MCP server's stdin (buffered by the pipe transport if it is busy)."""
+        if not self._stdin or self._stdin.is_closing():
+            raise Exception(f"MCP server '{self.name}' is not running")
+        self._stdin.write(frame)
 
-    async def _read_responses(self) -> None:
-        """Read responses from the MCP server's stdout."""
-        if not self.process or not self.process.stdout:
+    def _stdin_lost(self, exc: Optional[Exception]) -> None:
+        """Handle the stdin pipe being closed; on a write error, fail the requests waiting for a response."""
+        if exc is None:
             return
 
-        try:
-            while True:
-                line = await self.process.stdout.readline()
-                if not line:
-                    break
-
-                try:
-                    message = json.loads(line.decode().strip())
-
-                    # Handle response to a request
-                    if "id" in message and message["id"] in self.pending_requests:
-                        future = self.pending_requests.pop(message["id"])
-                        future.set_result(message)
-
-                    # Handle notifications
-                    elif "method" in message:
-                        logger.debug(f"Received notification from '{self.name}': {message['method']}")
-
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse message from '{self.name}': {e}")
+        logger.error("Error writing to MCP server '%s': %s", self.name, exc)
+        self._fail_pending(f"Failed to write to MCP server: {exc}")
 
-        except Exception as e:
-            logger.error(f"Error reading from MCP server '{self.name}': {e}")
+    def _message_too_large(self, head: bytes, tail: bytes) -> None:
+        """
+        Handle a message from the server that exceeded stream_limit and was dropped.
+        A response fails the request it answers; notifications and server requests are only dropped.
+        If the response id can't be found, all waiting requests fail instead of timing out.
+        """
+        error = f"Response from MCP server exceeds the stream limit of {self.stream_limit} bytes"
+        keys = _MESSAGE_KEY.finditer(head)
+        first = next(keys, None)
 
-    async def _read_stderr(self) -> None:
-        """Read and log stderr from the MCP server."""
-        if not self.process or not self.process.stderr:
+        if first and first[1] in (b"method", b"params"):
+            return
+        if first and first[1] == b"id" and first[2] is not None:
+            second = next(keys, None)
+            if second and second[1] in (b"method", b"params"):
+                return  # Request from the server (its ids are not ours)
+            request_id = int(first[2])
+        elif trailing := _TRAILING_ID.search(tail):
+            request_id = int(trailing[1])
+        else:
+            self._fail_pending(error)
             return
 
+        future = self.pending_requests.get(request_id)
+        if future and not future.done():
+            future.set_result({"error": {"code": -1, "message": error}})
+
+    def _fail_pending(self, message: str) -> None:
+        """Resolve all requests waiting for a response with an error."""
+        for future in self.pending_requests.values():
+            if not future.done():
+                future.set_result({"error": {"code": -1, "message": message}})
+
+    def _handle_frame(self, frame: bytes) -> None:
+        """
+        Handle one message from the MCP server's stdout.
+        Called synchronously by the framer, so all messages of a read are handled in the same loop iteration.
+        """
         try:
-            while True:
-                line = await self.process.stderr.readline()
-                if not line:
-                    break
+            # Parse the raw frame bytes directly (no decode/strip); surrounding whitespace such as '\r' is ignored
+            message = _loads(frame)
 
-                stderr_text = line.decode().strip()
-                if stderr_text:
-                    logger.warning(f"[{self.name} stderr] {stderr_text}")
+            # Handle notifications (and requests from the server, whose ids are not ours)
+            if "method" in message:
+                logger.debug("Received notification from '%s': %s", self.name, message['method'])
 
+            # Handle response to a request (late responses to timed-out requests are dropped)
+            elif "id" in message:
+                future = self.pending_requests.pop(message["id"], None)
+                if future and not future.done():
+                    future.set_result(message)
+
+        except json.JSONDecodeError as e:
+            logger.error("Failed to parse message from '%s': %s", self.name, e)
         except Exception as e:
-            logger.error(f"Error reading stderr from MCP server '{self.name}': {e}")
+            logger.error("Error reading from MCP server '%s': %s", self.name, e)
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a tool on the MCP server."""
@@ -245,28 +435,34 @@ class MCPServer:
         result = response.get("result", {})
         content = result.get("content", [])
 
+        response_data = {
+            "isError": result.get("isError", False)
+        }
+
+        # Fast path: a single text item (the most common tool result)
+        if len(content) == 1 and content[0].get("type") == "text":
+            response_data["result"] = content[0].get("text", "")
+            return response_data
+
         # Extract text and images from content
-        text_parts = []
+        has_text = False
         images = []
 
         for item in content:
-            if item.get("type") == "text":
-                text_parts.append(item.get("text", ""))
-            elif item.get("type") == "image":
+            item_type = item.get("type")
+            if item_type == "text":
+                has_text = True
+            elif item_type == "image":
                 images.append({
                     "data": item.get("data", ""),
                     "mimeType": item.get("mimeType", "image/png")
                 })
 
-        response_data = {
-            "isError": result.get("isError", False)
-        }
-
         # Combine text results
-        if text_parts:
-            response_data["result"] = "\n".join(text_parts)
+        if has_text:
+            response_data["result"] = "\n".join(item.get("text", "") for item in content if item.get("type") == "text")
         else:
-            response_data["result"] = json.dumps(result)
+            response_data["result"] = _dumps(result).decode()
 
         # Add image data if present
         if images:
@@ -276,30 +472,22 @@ class MCPServer:
 
     async def stop(self) -> None:
         """Stop the MCP server process."""
-        if self.reader_task:
-            self.reader_task.cancel()
+        if self.transport:
+            # Only signal a process that is still running (it may have exited on its own)
+            if self.transport.get_returncode() is None:
+                self.transport.terminate()
+                done, _ = await asyncio.wait((self.protocol.exited,), timeout=5.0)
+                if not done:
+                    self.transport.kill()
+                    await self.protocol.exited
 
-        if self.process:
-            self.process.terminate()
-            try:
-                await asyncio.wait_for(self.process.wait(), timeout=5.0)
-            except asyncio.TimeoutError:
-                self.process.kill()
-                await self.process.wait()
+            self.transport.close()
 
             logger.info(f"MCP server '{self.name}' stopped")
 
     def get_tools(self) -> List[Dict[str, Any]]:
-        """Get the list of tools with server name prefix."""
-        # Add server name prefix to tool names to avoid conflicts
-        prefixed_tools = []
-        for tool in self.tools:
-            prefixed_tool = tool.copy()
-            prefixed_tool["name"] = f"{self.name}__{tool['name']}"
-            prefixed_tool["mcp_server"] = self.name
-            prefixed_tool["original_name"] = tool["name"]
-            prefixed_tools.append(prefixed_tool)
-        return prefixed_tools
+        """Get the list of tools with server name prefix (cached, must not be modified by callers)."""
+        return self._prefixed_tools
 
 
 class MCPManager:
@@ -308,6 +496,14 @@ class MCPManager:
     def __init__(self, config_path: Path):
         self.config_path = config_path
         self.servers: Dict[str, MCPServer] = {}
+        self._tool_route: Dict[str, Tuple[MCPServer, str]] = {}  # Prefixed tool name -> (server, original tool name)
+        self._which_cache: Dict[str, Optional[str]] = {}  # Command -> resolved path (None if not found)
+
+    def _resolve(self, command: str) -> Optional[str]:
+        """Resolve a command in PATH, once per command for the lifetime of the manager."""
+        if command not in self._which_cache:
+            self._which_cache[command] = shutil.which(command)
+        return self._which_cache[command]
 
     async def start_all(self) -> None:
         """Start all configured MCP servers."""
@@ -321,45 +517,70 @@ class MCPManager:
 
             mcp_servers = config.get("mcpServers", {})
 
-            for name, server_config in mcp_servers.items():
-                try:
-                    # Get timeout from config, default to 120 seconds
-                    timeout = server_config.get("timeout", 120.0)
-
-                    server = MCPServer(
-                        name=name,
-                        command=server_config["command"],
-                        args=server_config.get("args", []),
-                        env=server_config.get("env", {}),
-                        timeout=timeout
-                    )
-                    await server.start()
-                    self.servers[name] = server
-                    logger.info(f"MCP server '{name}' configured with {timeout}s timeout")
-                except Exception as e:
-                    logger.error(f"Failed to start MCP server '{name}': {e}")
+            # Start all servers concurrently; startup time is that of the slowest server
+            names = list(mcp_servers)
+            results = await asyncio.gather(
+                *(self._start_one(name, mcp_servers[name]) for name in names),
+                return_exceptions=True
+            )
+
+            for name, result in zip(names, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Failed to start MCP server '{name}': {result}")
+                else:
+                    self.servers[name] = result
+                    for tool in result.get_tools():
+                        self._tool_route[tool["name"]] = (result, tool["original_name"])
 
             logger.info(f"Started {len(self.servers)} MCP servers")
 
         except Exception as e:
             logger.error(f"Failed to load MCP config: {e}")
 
+    async def _start_one(self, name: str, server_config: Dict[str, Any]) -> MCPServer:
+        """Create and start a single MCP server from its config entry."""
+        # Get timeout from config, default to 120 seconds
+        timeout = server_config.get("timeout", 120.0)
+
+        # The manager's lookup is authoritative: a command that isn't found (even if cached) fails here
+        command = server_config["command"]
+        command_path = self._resolve(command)
+        if not command_path:
+            logger.error(f"Command '{command}' not found in PATH. Please ensure it's installed and available.")
+            raise FileNotFoundError(f"Command not found: {command}")
+
+        server = MCPServer(
+            name=name,
+            command=command,
+            args=server_config.get("args", []),
+            env=server_config.get("env", {}),
+            timeout=timeout,
+            stream_limit=server_config.get("limit", DEFAULT_STREAM_LIMIT),
+            command_path=command_path
+        )
+        await server.start()
+        logger.info(f"MCP server '{name}' configured with {timeout}s timeout")
+        return server
+
     async def stop_all(self) -> None:
         """Stop all MCP servers."""
         for server in self.servers.values():
             await server.stop()
         self.servers.clear()
+        self._tool_route.clear()
 
     def get_all_tools(self) -> List[Dict[str, Any]]:
         """Get all tools from all MCP servers."""
-        all_tools = []
-        for server in self.servers.values():
-            all_tools.extend(server.get_tools())
-        return all_tools
+        return list(itertools.chain.from_iterable(server.get_tools() for server in self.servers.values()))
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a tool on the appropriate MCP server."""
-        # Extract server name from tool name (format: servername__toolname)
+        route = self._tool_route.get(tool_name)
+        if route:
+            server, original_tool_name = route
+            return await server.call_tool(original_tool_name, arguments)
+
+        # Not a known tool - extract server name from tool name (format: servername__toolname)
         if "__" not in tool_name:
             return {"error": f"Invalid tool name format: {tool_name}", "isError": True}
 